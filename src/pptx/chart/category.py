@@ -8,6 +8,7 @@ discovery of the depth of that hierarchy and providing means to navigate it.
 
 from __future__ import annotations
 
+import bisect
 from collections.abc import Sequence
 from typing import TYPE_CHECKING
 
@@ -74,14 +75,29 @@ class Categories(Sequence):
             return ()
 
         if cat.multiLvlStrRef is None:
-            return tuple([(category.label,) for category in self])
+            return tuple([(label,) for _, label in self._iter_pt_labels(self._xChart.cat_pts)])
 
-        return tuple(
-            [
-                tuple([category.label for category in reversed(flat_cat)])
-                for flat_cat in self._iter_flattened_categories()
-            ]
-        )
+        lvls = cat.lvls
+        if not lvls:
+            return ()
+
+        # -- one column of labels per level, leaf level first, read from the XML without
+        # -- constructing |Category| objects. A parent category is the category in a next
+        # -- level having the maximum idx value not exceeding that of the leaf category; the
+        # -- first parent is the default for any leading leaves that have no parent.
+        leaf_idxs, leaf_labels = lvls[0].pt_idxs_and_labels
+        columns = [leaf_labels]
+        for lvl in lvls[1:]:
+            idxs, labels = lvl.pt_idxs_and_labels
+            # guard against edge case where next level is present but empty. That
+            # situation is not prohibited for some reason.
+            if not labels:
+                break
+            columns.append(
+                [labels[max(bisect.bisect_right(idxs, idx) - 1, 0)] for idx in leaf_idxs]
+            )
+
+        return tuple(zip(*reversed(columns)))
 
     @property
     def levels(self):
@@ -105,6 +121,8 @@ class Categories(Sequence):
         This method updates both the embedded Excel workbook data and the XML string cache
         to ensure the category labels are changed throughout the chart.
 
+        Nothing is written when `new_categories` matches the current labels.
+
         Args:
             new_categories: A list or tuple of string values for the new category labels.
                 Must have the same length as the current categories.
@@ -125,62 +143,33 @@ class Categories(Sequence):
         if self._chart_part is None:
             raise ValueError("Cannot update categories: chart_part not available")
 
+        # -- read `c:cat` and the current labels from the XML as it is now; it may have been
+        # -- replaced (e.g. by `Chart.replace_data()`) since this object was first accessed
+        cat = self._xChart.cat
+
+        # Skip both workbook and XML rewrites when labels are unchanged
+        current_labels = [label for _, label in self._iter_pt_labels(self._xChart.cat_pts)]
+        if list(new_categories) == current_labels:
+            return
+
         # Update the embedded Excel workbook
         chart_workbook = self._chart_part.chart_workbook
         chart_workbook.update_categories(new_categories)
 
         # Update the XML string cache
-        cat = self._xChart.cat
         if cat is not None:
             cat.update_str_cache(new_categories)
 
-    def _iter_flattened_categories(self):
+    @staticmethod
+    def _iter_pt_labels(cat_pts):
         """
-        Generate a ``tuple`` object for each leaf category in this
-        collection, containing the leaf category followed by its "parent"
-        categories, e.g. ``('San Francisco', 'CA', 'USA'). Each tuple will be
-        the same length as the number of levels (excepting certain edge
-        cases which I believe always indicate a chart construction error).
+        Generate an `(idx, label)` pair for each of the leaf-category `cat_pts`,
+        read directly from its `c:pt` element rather than by constructing a
+        |Category| object. Labels match those of the |Category| objects, so the
+        label of a "missing" category (a |None| item) is the empty string.
         """
-        levels = self.levels
-        if not levels:
-            return
-        leaf_level, remaining_levels = levels[0], levels[1:]
-        for category in leaf_level:
-            yield self._parentage((category,), remaining_levels)
-
-    def _parentage(self, categories, levels):
-        """
-        Return a tuple formed by recursively concatenating *categories* with
-        its next ancestor from *levels*. The idx value of the first category
-        in *categories* determines parentage in all levels. The returned
-        sequence is in child -> parent order. A parent category is the
-        Category object in a next level having the maximum idx value not
-        exceeding that of the leaf category.
-        """
-        # exhausting levels is the expected recursion termination condition
-        if not levels:
-            return tuple(categories)
-
-        # guard against edge case where next level is present but empty. That
-        # situation is not prohibited for some reason.
-        if not levels[0]:
-            return tuple(categories)
-
-        parent_level, remaining_levels = levels[0], levels[1:]
-        leaf_node = categories[0]
-
-        # Make the first parent the default. A possible edge case is where no
-        # parent is defined for one or more leading values, e.g. idx > 0 for
-        # the first parent.
-        parent = parent_level[0]
-        for category in parent_level:
-            if category.idx > leaf_node.idx:
-                break
-            parent = category
-
-        extended_categories = tuple(categories) + (parent,)
-        return self._parentage(extended_categories, remaining_levels)
+        for idx, pt in enumerate(cat_pts):
+            yield idx, "" if pt is None else str(pt.v.text)
 
 
 class Category(str):
@@ -190,6 +179,9 @@ class Category(str):
     category.
     """
 
+    # -- many of these can be created for a large chart; slots avoid a per-instance __dict__ --
+    __slots__ = ("_element", "_pt", "_idx")
+
     def __new__(cls, pt, *args):
         category_label = "" if pt is None else pt.v.text
         return str.__new__(cls, category_label)
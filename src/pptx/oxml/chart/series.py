@@ -108,6 +108,22 @@ class CT_Lvl(BaseOxmlElement):
 
     pt = ZeroOrMore("c:pt", successors=())
 
+    @property
+    def pt_idxs_and_labels(self):
+        """
+        2-tuple of parallel lists, the int `idx` values and the str labels of
+        the `c:pt` children of this level, in document order. Both values are
+        read from each `c:pt` element in a single pass, so they always belong
+        to the same point; a `c:pt` missing its `idx` attribute or `c:v` child
+        raises |InvalidXmlError|. Labels match those of the corresponding
+        |Category| objects, so an empty `c:v` element produces "None".
+        """
+        idxs, labels = [], []
+        for pt in self.pt_lst:
+            idxs.append(pt.idx)
+            labels.append(str(pt.v.text))
+        return idxs, labels
+
 
 class CT_NumDataSource(BaseOxmlElement):
     """
@@ -134,7 +150,7 @@ class CT_NumDataSource(BaseOxmlElement):
         Return the Y value for data point *idx* in this cache, or None if no
         value is present for that data point.
         """
-        results = self.xpath(".//c:pt[@idx=%d]" % idx)
+        results = self.xpath(".//c:pt[@idx=$idx]", idx=idx)
         return results[0].value if results else None
 
 
@@ -231,7 +247,7 @@ class CT_SeriesComposite(BaseOxmlElement):
         Return the `c:dPt` child representing the visual properties of the
         data point at index *idx*.
         """
-        matches = self.xpath('c:dPt[c:idx[@val="%d"]]' % idx)
+        matches = self.xpath("c:dPt[c:idx[@val=$idx]]", idx=str(idx))
         if matches:
             return matches[0]
         dPt = self._add_dPt()
@@ -4,13 +4,35 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Iterator
 
-from pptx.oxml.ns import qn
+from lxml import etree
+
+from pptx.oxml.ns import _nsmap, qn  # pyright: ignore[reportPrivateUsage]
 from pptx.oxml.xmlchemy import BaseOxmlElement, OneAndOnlyOne, OptionalAttribute, ZeroOrOne
 from pptx.oxml.simpletypes import XsdString
 
 if TYPE_CHECKING:
     pass
 
+_PT_TAG = qn("dgm:pt")
+_CXN_TAG = qn("dgm:cxn")
+
+# -- compiled once; selects every `a:t` (text run) descendant of the context element --
+_A_T_XPATH = etree.XPath(".//a:t", namespaces=_nsmap)
+
+# -- `a:t` elements in the `dgm:t` child of a `dgm:pt`, and the text of those elements as
+# -- plain `str` values. A point having no `dgm:t` child produces an empty result.
+_PT_A_T_XPATH = etree.XPath("./dgm:t//a:t", namespaces=_nsmap)
+_PT_TEXT_XPATH = etree.XPath("./dgm:t//a:t/text()", namespaces=_nsmap, smart_strings=False)
+
+# -- `dgm:pt` children that are content nodes, i.e. not presentation (layout) or transition
+# -- points. The filter is evaluated by libxml2 rather than per-element in Python.
+_NODE_PTS = "./dgm:pt[not(@type='pres' or @type='parTrans' or @type='sibTrans')]"
+_NODE_PTS_XPATH = etree.XPath(_NODE_PTS, namespaces=_nsmap)
+_NODE_COUNT_XPATH = etree.XPath(f"count({_NODE_PTS})", namespaces=_nsmap)
+
+# -- selects the `dgm:pt` child having `modelId` matching the `$model_id` XPath variable --
+_PT_BY_MODEL_ID_XPATH = etree.XPath("./dgm:pt[@modelId=$model_id]", namespaces=_nsmap)
+
 
 class CT_DiagramData(BaseOxmlElement):
     """<dgm:dataModel> element - root element of diagram data."""
@@ -28,8 +50,31 @@ class CT_DiagramPointList(BaseOxmlElement):
 
     def iter_pts(self) -> Iterator[CT_DiagramPoint]:
         """Generate each <dgm:pt> child element."""
-        for pt in self.findall(qn("dgm:pt")):
-            yield pt
+        yield from self.iterchildren(_PT_TAG)
+
+    def get_pt(self, model_id: str) -> CT_DiagramPoint | None:
+        """The `dgm:pt` child having `modelId` of `model_id`, or |None| if not present."""
+        pts = _PT_BY_MODEL_ID_XPATH(self, model_id=model_id)
+        return pts[0] if pts else None
+
+    def pt_by_model_id(self) -> dict[str, CT_DiagramPoint]:
+        """Mapping of `modelId` to `dgm:pt` child element, for each point having a modelId.
+
+        Built fresh on each call, so it reflects the current children. Callers that resolve many
+        ids, such as the `srcId`/`destId` of each connection, should build it once and reuse it.
+        """
+        pts = self.iterchildren(_PT_TAG)
+        return {pt.get("modelId"): pt for pt in pts if pt.get("modelId") is not None}
+
+    @property
+    def node_pts(self) -> list[CT_DiagramPoint]:
+        """`dgm:pt` children that are neither presentation nor transition points."""
+        return _NODE_PTS_XPATH(self)
+
+    @property
+    def node_count(self) -> int:
+        """Number of `dgm:pt` children that are neither presentation nor transition points."""
+        return int(_NODE_COUNT_XPATH(self))
 
 
 class CT_DiagramPoint(BaseOxmlElement):
@@ -44,19 +89,14 @@ class CT_DiagramPoint(BaseOxmlElement):
     @property
     def text(self) -> str:
         """Extract all text content from this point."""
-        if self.t is None:
-            return ""
-        # Extract text from all <a:t> elements
-        text_elements = self.t.findall(".//" + qn("a:t"))
-        return "".join(el.text for el in text_elements if el.text)
+        # -- text of all <a:t> elements, evaluated in a single XPath call --
+        return "".join(_PT_TEXT_XPATH(self))
 
     @text.setter
     def text(self, value: str) -> None:
         """Set text content for this point."""
-        if self.t is None:
-            return
         # Find all <a:t> elements and set the text to the first one, clear others
-        text_elements = self.t.findall(".//" + qn("a:t"))
+        text_elements = _PT_A_T_XPATH(self)
         if text_elements:
             # Set text in first element, clear the rest
             text_elements[0].text = value
@@ -75,8 +115,7 @@ class CT_DiagramConnectionList(BaseOxmlElement):
 
     def iter_cxns(self) -> Iterator[CT_DiagramConnection]:
         """Generate each <dgm:cxn> child element."""
-        for cxn in self.findall(qn("dgm:cxn")):
-            yield cxn
+        yield from self.iterchildren(_CXN_TAG)
 
 
 class CT_DiagramConnection(BaseOxmlElement):
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import re
 from typing import Any, Callable, Iterable, Protocol, Sequence, Type, cast
 
@@ -32,6 +33,18 @@ class AttributeType(Protocol):
         ...
 
 
+@functools.lru_cache(maxsize=512)
+def compiled_xpath(xpath_str: str) -> etree.XPath:
+    """Return an `etree.XPath` object for `xpath_str`, using the standard Open XML namespaces.
+
+    Compilation happens only on the first request for a given expression; later requests for the
+    same string return the cached object. Per-call values belong in XPath variables rather than
+    the expression text, which keeps the set of distinct expressions small; the cache is bounded
+    regardless.
+    """
+    return etree.XPath(xpath_str, namespaces=_nsmap)
+
+
 def OxmlElement(nsptag_str: str, nsmap: dict[str, str] | None = None) -> BaseOxmlElement:
     """Return a "loose" lxml element having the tag specified by `nsptag_str`.
 
@@ -705,12 +718,17 @@ class BaseOxmlElement(etree.ElementBase, metaclass=MetaOxmlElement):
         """
         return serialize_for_reading(self)
 
-    def xpath(self, xpath_str: str) -> Any:  # pyright: ignore[reportIncompatibleMethodOverride]
+    def xpath(  # pyright: ignore[reportIncompatibleMethodOverride]
+        self, xpath_str: str, **variables: Any
+    ) -> Any:
         """Override of `lxml` _Element.xpath() method.
 
-        Provides standard Open XML namespace mapping (`nsmap`) in centralized location.
+        Provides standard Open XML namespace mapping (`nsmap`) in centralized location. The
+        expression is compiled once and reused by later calls, see `compiled_xpath()`. Values that
+        vary per call, like an idx, are passed as `variables` and referenced in the expression as
+        `$name`, so they do not produce a distinct expression to compile and cache.
         """
-        return super().xpath(xpath_str, namespaces=_nsmap)
+        return compiled_xpath(xpath_str)(self, **variables)
 
     @property
     def _nsptag(self) -> str:
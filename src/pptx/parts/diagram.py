@@ -6,6 +6,7 @@ from typing import TYPE_CHECKING, cast
 
 from pptx.opc.package import Part, XmlPart
 from pptx.oxml import parse_xml
+from pptx.oxml.diagram import _A_T_XPATH  # pyright: ignore[reportPrivateUsage]
 
 if TYPE_CHECKING:
     from pptx.opc.package import Package
@@ -52,15 +53,13 @@ class DiagramDrawingPart(XmlPart):
 
     def update_all_text_elements(self, text_list: list[str]) -> None:
         """Update all text elements in drawing order with new texts."""
-        from pptx.oxml.ns import qn
-
         # Find all <a:t> elements in the drawing
-        text_elements = self._element.findall(".//" + qn("a:t"))
+        text_elements = _A_T_XPATH(self._element)
 
-        # Update each text element with corresponding text from list
-        for idx, text_el in enumerate(text_elements):
-            if idx < len(text_list):
-                text_el.text = text_list[idx]
+        # Update each text element with corresponding text from list; zip() stops at the
+        # shorter of the two, leaving any surplus text elements unchanged
+        for text_el, text in zip(text_elements, text_list):
+            text_el.text = text
 
     @classmethod
     def load(
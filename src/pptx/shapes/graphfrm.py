@@ -65,7 +65,7 @@ class GraphicFrame(BaseShape):
 
         When |True|, the chart object can be accessed using the `.chart` property.
         """
-        return self._graphicFrame.graphicData_uri == GRAPHIC_DATA_URI_CHART
+        return self._graphicData_uri == GRAPHIC_DATA_URI_CHART
 
     @property
     def has_smartart(self) -> bool:
@@ -73,7 +73,7 @@ class GraphicFrame(BaseShape):
 
         When |True|, the SmartArt object can be accessed using the `.smartart` property.
         """
-        return self._graphicFrame.graphicData_uri == GRAPHIC_DATA_URI_DIAGRAM
+        return self._graphicData_uri == GRAPHIC_DATA_URI_DIAGRAM
 
     @property
     def has_table(self) -> bool:
@@ -81,7 +81,7 @@ class GraphicFrame(BaseShape):
 
         When |True|, the table object can be accessed using the `.table` property.
         """
-        return self._graphicFrame.graphicData_uri == GRAPHIC_DATA_URI_TABLE
+        return self._graphicData_uri == GRAPHIC_DATA_URI_TABLE
 
     @property
     def ole_format(self) -> _OleFormat:
@@ -133,7 +133,7 @@ class GraphicFrame(BaseShape):
 
         This value is `None` when none of these types apply.
         """
-        graphicData_uri = self._graphicFrame.graphicData_uri
+        graphicData_uri = self._graphicData_uri
         if graphicData_uri == GRAPHIC_DATA_URI_CHART:
             return MSO_SHAPE_TYPE.CHART
         elif graphicData_uri == GRAPHIC_DATA_URI_TABLE:
@@ -160,6 +160,14 @@ class GraphicFrame(BaseShape):
         tbl = self._graphicFrame.graphic.graphicData.tbl
         return Table(tbl, self)
 
+    @lazyproperty
+    def _graphicData_uri(self) -> str:
+        """`uri` of the `a:graphicData` element, which identifies the kind of graphic framed.
+
+        Read once, since the `has_*` and `shape_type` properties each dispatch on it.
+        """
+        return self._graphicFrame.graphicData_uri
+
 
 class _OleFormat(ParentedElementProxy):
     """Provides attributes on an embedded OLE object."""
@@ -2,13 +2,13 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Iterator
+from typing import TYPE_CHECKING, Iterable, Iterator
 
 from pptx.shared import ParentedElementProxy
 
 if TYPE_CHECKING:
     from pptx.oxml.diagram import CT_DiagramPoint, CT_DiagramPointList
-    from pptx.parts.diagram import DiagramDataPart
+    from pptx.parts.diagram import DiagramDataPart, DiagramDrawingPart
 
 
 class SmartArt(ParentedElementProxy):
@@ -17,6 +17,7 @@ class SmartArt(ParentedElementProxy):
     def __init__(self, data_part: DiagramDataPart, parent):
         super().__init__(data_part.data_model, parent)
         self._data_part = data_part
+        self._drawing_parts_cache: list[DiagramDrawingPart] | None = None
 
     @property
     def nodes(self) -> _SmartArtNodes:
@@ -25,18 +26,37 @@ class SmartArt(ParentedElementProxy):
 
     def iter_text(self) -> Iterator[str]:
         """Generate all text content from diagram nodes."""
-        for node in self.nodes:
-            text = node.text
+        # -- read point text directly; a SmartArtNode proxy per point is not needed here --
+        for pt in self._element.ptLst.node_pts:
+            text = pt.text
             if text:
                 yield text
 
+    def set_node_texts(self, texts: Iterable[str]) -> None:
+        """Assign each of `texts` to the corresponding node, in node order.
+
+        Equivalent to setting `.text` on each node in turn, but the drawing part is synchronized
+        only once, after all texts are assigned. Nodes beyond the end of `texts` are unchanged.
+        """
+        for node, text in zip(self.nodes, texts):
+            node._pt.text = text
+        self._sync_drawing_part()
+
     @property
     def text_content(self) -> list[str]:
         """List of all text strings from diagram nodes."""
         return list(self.iter_text())
 
-    def _sync_drawing_part(self) -> None:
-        """Sync drawing part with current data model texts."""
+    @property
+    def _drawing_parts(self) -> list[DiagramDrawingPart]:
+        """Drawing parts related to the slide containing this SmartArt object.
+
+        Relationships are resolved on first access only; the result is cached for the lifetime of
+        this object.
+        """
+        if self._drawing_parts_cache is not None:
+            return self._drawing_parts_cache
+
         # Find drawing part through parent slide relationships
         from pptx.opc.constants import RELATIONSHIP_TYPE as RT
         from pptx.parts.diagram import DiagramDrawingPart
@@ -47,55 +67,65 @@ class SmartArt(ParentedElementProxy):
             parent = getattr(parent, '_parent', None)
 
         if not parent:
-            return
+            self._drawing_parts_cache = []
+            return self._drawing_parts_cache
 
         slide_part = parent.part
 
-        # Find drawing part relationship
-        drawing_rels = [
-            rel
+        # Find drawing part relationships
+        self._drawing_parts_cache = [
+            rel.target_part
             for rel in slide_part.rels.values()
-            if rel.reltype == RT.DIAGRAM_DRAWING
+            if rel.reltype == RT.DIAGRAM_DRAWING and isinstance(rel.target_part, DiagramDrawingPart)
         ]
+        return self._drawing_parts_cache
 
-        if not drawing_rels:
+    def _sync_drawing_part(self) -> None:
+        """Sync drawing part with current data model texts."""
+        drawing_parts = self._drawing_parts
+        if not drawing_parts:
             return
 
         # Update all text elements in drawing with texts from data model
         texts = self.text_content
-        for rel in drawing_rels:
-            drawing_part = rel.target_part
-            if isinstance(drawing_part, DiagramDrawingPart):
-                drawing_part.update_all_text_elements(texts)
+        for drawing_part in drawing_parts:
+            drawing_part.update_all_text_elements(texts)
 
 
 class _SmartArtNodes(ParentedElementProxy):
     """Collection of SmartArt nodes."""
 
+    __slots__ = ("_data_part", "_smartart")
+
     def __init__(self, ptLst: CT_DiagramPointList, parent, data_part):
         super().__init__(ptLst, parent)
         self._data_part = data_part
+        # -- the parent of this collection is the SmartArt object that owns it --
+        self._smartart = parent
 
     def __iter__(self) -> Iterator[SmartArtNode]:
         """Generate each node in the collection."""
-        for pt in self._element.iter_pts():
-            # Skip presentation nodes (type="pres") - they're layout metadata
-            # Also skip transition nodes (parTrans, sibTrans)
-            if pt.type not in ("pres", "parTrans", "sibTrans"):
-                yield SmartArtNode(pt, self, self._data_part)
+        # -- presentation nodes (type="pres") are layout metadata and transition nodes
+        # -- (parTrans, sibTrans) are not content, so neither is included
+        data_part, smartart = self._data_part, self._smartart
+        for pt in self._element.node_pts:
+            yield SmartArtNode(pt, self, data_part, smartart)
 
     def __len__(self) -> int:
         """Number of nodes."""
-        return sum(1 for _ in self)
+        return self._element.node_count
 
 
 class SmartArtNode(ParentedElementProxy):
     """A single node in a SmartArt diagram."""
 
-    def __init__(self, pt: CT_DiagramPoint, parent, data_part):
+    __slots__ = ("_pt", "_data_part", "_smartart")
+
+    def __init__(self, pt: CT_DiagramPoint, parent, data_part, smartart: SmartArt | None = None):
         super().__init__(pt, parent)
         self._pt = pt
         self._data_part = data_part
+        self._smartart = smartart
 
     @property
     def text(self) -> str:
@@ -105,22 +135,21 @@ class SmartArtNode(ParentedElementProxy):
     @text.setter
     def text(self, value: str) -> None:
         """Set text content of this node."""
+        # Nothing to do when text is unchanged; avoids a needless drawing-part rewrite
+        if value == self._pt.text:
+            return
+
         # Update data.xml
         self._pt.text = value
 
         # Update drawing.xml cache if it exists
         # The drawing part is a Microsoft extension that caches rendered output
         # We need to update it so apps like Keynote show the correct text
-        if self._data_part is None:
+        smartart = self._smartart
+        if smartart is None or self._data_part is None:
             return
 
-        # Get the parent SmartArt object by walking up the parent chain
-        parent = self._parent
-        while parent is not None:
-            if isinstance(parent, SmartArt):
-                parent._sync_drawing_part()
-                break
-            parent = getattr(parent, '_parent', None)
+        smartart._sync_drawing_part()
 
     @property
     def model_id(self) -> str | None:
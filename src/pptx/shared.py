@@ -18,6 +18,8 @@ class ElementProxy(object):
     python-pptx other than custom element (oxml) classes.
     """
 
+    __slots__ = ("_element",)
+
     def __init__(self, element: BaseOxmlElement):
         self._element = element
 
@@ -51,6 +53,8 @@ class ParentedElementProxy(ElementProxy):
     :attr:`parent` read-only property.
     """
 
+    __slots__ = ("_parent",)
+
     def __init__(self, element: BaseOxmlElement, parent: ProvidesPart):
         super(ParentedElementProxy, self).__init__(element)
         self._parent = parent
@@ -72,6 +76,8 @@ class ParentedElementProxy(ElementProxy):
 class PartElementProxy(ElementProxy):
     """Provides common members for proxy-objects that wrap a part's root element, e.g. `p:sld`."""
 
+    __slots__ = ("_part",)
+
     def __init__(self, element: BaseOxmlElement, part: XmlPart):
         super(PartElementProxy, self).__init__(element)
         self._part = part
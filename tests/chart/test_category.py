@@ -4,7 +4,10 @@ from __future__ import annotations
 
 import pytest
 
+from pptx import Presentation
 from pptx.chart.category import Categories, Category, CategoryLevel
+from pptx.chart.data import CategoryChartData
+from pptx.enum.chart import XL_CHART_TYPE
 from pptx.oxml import parse_xml
 
 from ..unitutil.cxml import element
@@ -42,6 +45,42 @@ class DescribeCategories(object):
         flattened_labels = categories.flattened_labels
         assert flattened_labels == expected_values
 
+    def it_flattens_labels_the_same_as_its_categories(self):
+        xChart = element(
+            'c:barChart/c:ser/c:cat/c:strRef/c:strCache/(c:pt{idx=0}/c:v,c:pt{idx=1}/c:v"B")'
+        )
+        categories = Categories(xChart)
+        assert categories.flattened_labels == tuple((c,) for c in categories)
+
+    def it_defaults_to_the_first_parent_for_leading_orphan_categories(self):
+        xChart = element(
+            "c:barChart/c:ser/c:cat/c:multiLvlStrRef/c:multiLvlStrCache/("
+            'c:lvl/(c:pt{idx=0}/c:v"a",c:pt{idx=1}/c:v"b",c:pt{idx=2}/c:v"c"),'
+            'c:lvl/(c:pt{idx=1}/c:v"P",c:pt{idx=2}/c:v"Q"))'
+        )
+        categories = Categories(xChart)
+        assert categories.flattened_labels == (("P", "a"), ("P", "b"), ("Q", "c"))
+
+    def it_reflects_category_changes_made_by_replacing_the_chart_data(self):
+        chart = _column_chart(_chart_data(["a", "b"]))
+        categories = chart.plots[0].categories
+        assert (len(categories), list(categories)) == (2, ["a", "b"])
+
+        chart.replace_data(_chart_data(["x", "y", "z"]))
+
+        assert (len(categories), list(categories)) == (3, ["x", "y", "z"])
+        assert categories[2] == "z"
+        assert categories.flattened_labels == (("x",), ("y",), ("z",))
+
+    def it_reflects_hierarchy_changes_made_by_replacing_the_chart_data(self):
+        chart = _column_chart(_chart_data({"G": ["a", "b"]}))
+        categories = chart.plots[0].categories
+        assert categories.flattened_labels == (("G", "a"), ("G", "b"))
+
+        chart.replace_data(_chart_data({"H": ["x", "y", "z"]}))
+
+        assert categories.flattened_labels == (("H", "x"), ("H", "y"), ("H", "z"))
+
     def it_provides_access_to_its_levels(self, levels_fixture):
         categories, CategoryLevel_, calls, expected_levels = levels_fixture
         levels = categories.levels
@@ -262,6 +301,45 @@ class DescribeCategoriesUpdate(object):
         with pytest.raises(ValueError, match="chart_part not available"):
             categories.update_all(new_cats)
 
+    def it_reflects_its_own_label_update(self):
+        from unittest.mock import Mock
+
+        xChart = element(
+            'c:barChart/c:ser/c:cat/c:strRef/c:strCache/(c:ptCount{val=2},c:pt{idx=0}/c:v"Foo"'
+            ',c:pt{idx=1}/c:v"Bar")'
+        )
+        categories = Categories(xChart, Mock())
+        assert categories.flattened_labels == (("Foo",), ("Bar",))
+
+        categories.update_all(["Baz", "Zap"])
+
+        assert list(categories) == ["Baz", "Zap"]
+        assert categories.flattened_labels == (("Baz",), ("Zap",))
+
+    def but_it_skips_the_update_when_labels_are_unchanged(self):
+        from unittest.mock import Mock
+
+        xChart = element(
+            'c:barChart/c:ser/c:cat/c:strRef/c:strCache/(c:ptCount{val=2},c:pt{idx=0}/c:v"Foo"'
+            ',c:pt{idx=1}/c:v"Bar")'
+        )
+        chart_part_ = Mock()
+        categories = Categories(xChart, chart_part_)
+
+        categories.update_all(("Foo", "Bar"))
+
+        chart_part_.chart_workbook.update_categories.assert_not_called()
+
+    def it_updates_the_current_categories_after_the_chart_data_is_replaced(self):
+        chart = _column_chart(_chart_data(["a", "b"]))
+        categories = chart.plots[0].categories
+        assert categories.flattened_labels == (("a",), ("b",))
+
+        chart.replace_data(_chart_data(["x", "y", "z"]))
+        categories.update_all(["p", "q", "r"])
+
+        assert list(chart.plots[0].categories) == ["p", "q", "r"]
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
@@ -282,3 +360,36 @@ class DescribeCategoriesUpdate(object):
         categories = Categories(xChart, None)  # No chart_part
         new_cats = ["Jan", "Feb", "Mar"]
         return categories, new_cats
+
+
+# ===========================================================================
+# helpers
+# ===========================================================================
+
+
+def _chart_data(labels):
+    """Return a |CategoryChartData| object having category `labels` and one series.
+
+    When `labels` is a dict, each key is a parent category and its value is a list of the leaf
+    category labels under it.
+    """
+    chart_data = CategoryChartData()
+    if isinstance(labels, dict):
+        for parent_label, leaf_labels in labels.items():
+            parent = chart_data.add_category(parent_label)
+            for leaf_label in leaf_labels:
+                parent.add_sub_category(leaf_label)
+    else:
+        chart_data.categories = labels
+    chart_data.add_series("Series 1", range(chart_data.categories.leaf_count))
+    return chart_data
+
+
+def _column_chart(chart_data):
+    """Return a |Chart| object for a new column chart, on a slide of a new presentation."""
+    prs = Presentation()
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    graphic_frame = slide.shapes.add_chart(
+        XL_CHART_TYPE.COLUMN_CLUSTERED, 0, 0, 914400, 914400, chart_data
+    )
+    return graphic_frame.chart
@@ -0,0 +1,32 @@
+"""Unit-test suite for `pptx.oxml.chart.series` module."""
+
+from __future__ import annotations
+
+import pytest
+
+from pptx.chart.category import Category
+from pptx.exc import InvalidXmlError
+
+from ...unitutil.cxml import element
+
+
+class DescribeCT_Lvl(object):
+    """Unit-test suite for `pptx.oxml.chart.series.CT_Lvl` objects."""
+
+    def it_provides_the_idx_and_label_of_each_pt_in_document_order(self):
+        lvl = element('c:lvl/(c:pt{idx=4}/c:v"d",c:pt{idx=1}/c:v,c:pt{idx=2}/c:v"b")')
+
+        assert lvl.pt_idxs_and_labels == ([4, 1, 2], ["d", "None", "b"])
+
+    def it_labels_each_pt_the_same_as_its_Category(self):
+        lvl = element('c:lvl/(c:pt{idx=0}/c:v"a",c:pt{idx=1}/c:v)')
+
+        _, labels = lvl.pt_idxs_and_labels
+
+        assert labels == [Category(pt) for pt in lvl.pt_lst]
+
+    def but_it_raises_when_a_pt_has_no_v_child(self):
+        lvl = element('c:lvl/(c:pt{idx=0}/c:v"a",c:pt{idx=1},c:pt{idx=2}/c:v"c")')
+
+        with pytest.raises(InvalidXmlError):
+            lvl.pt_idxs_and_labels
@@ -4,9 +4,10 @@ from __future__ import annotations
 
 import pytest
 
+from pptx.exc import InvalidXmlError
 from pptx.oxml.shapes.graphfrm import CT_GraphicalObjectFrame
 
-from ...unitutil.cxml import xml
+from ...unitutil.cxml import element, xml
 
 CHART_URI = "http://schemas.openxmlformats.org/drawingml/2006/chart"
 TABLE_URI = "http://schemas.openxmlformats.org/drawingml/2006/table"
@@ -42,6 +43,19 @@ class DescribeCT_GraphicalObjectFrame(object):
         )
         assert graphicFrame.xml == expected_xml
 
+    def it_knows_the_uri_of_its_graphicData(self):
+        graphicFrame = element("p:graphicFrame/a:graphic/a:graphicData{uri=%s}" % TABLE_URI)
+
+        graphicData_uri = graphicFrame.graphicData_uri
+
+        assert graphicData_uri == TABLE_URI
+
+    def but_it_raises_when_the_graphicData_uri_is_missing(self):
+        graphicFrame = element("p:graphicFrame/a:graphic/a:graphicData")
+
+        with pytest.raises(InvalidXmlError):
+            graphicFrame.graphicData_uri
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
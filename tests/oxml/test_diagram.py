@@ -59,6 +59,51 @@ class DescribeCT_DiagramPointList:
         assert len(points) == 3
         assert all(isinstance(pt, CT_DiagramPoint) for pt in points)
 
+    def it_provides_access_to_its_content_nodes(self):
+        """Test selecting and counting points, excluding presentation and transition points."""
+        xml = (
+            '<dgm:ptLst xmlns:dgm="http://schemas.openxmlformats.org/drawingml/2006/diagram">'
+            '  <dgm:pt modelId="{id1}" type="doc"/>'
+            '  <dgm:pt modelId="{id2}"/>'
+            '  <dgm:pt modelId="{id3}" type="pres"/>'
+            '  <dgm:pt modelId="{id4}" type="parTrans"/>'
+            '  <dgm:pt modelId="{id5}" type="sibTrans"/>'
+            "</dgm:ptLst>"
+        )
+        pt_lst = parse_xml(xml)
+        pts = list(pt_lst.iter_pts())
+
+        assert pt_lst.node_pts == pts[:2]
+        assert pt_lst.node_count == 2
+
+    def it_can_get_a_point_by_model_id(self):
+        """Test looking up a point by its modelId."""
+        xml = (
+            '<dgm:ptLst xmlns:dgm="http://schemas.openxmlformats.org/drawingml/2006/diagram">'
+            '  <dgm:pt modelId="{id1}"/>'
+            '  <dgm:pt modelId="{id2}"/>'
+            "</dgm:ptLst>"
+        )
+        pt_lst = parse_xml(xml)
+        pts = list(pt_lst.iter_pts())
+
+        assert pt_lst.get_pt("{id2}") is pts[1]
+        assert pt_lst.get_pt("{id9}") is None
+
+    def it_can_map_model_ids_to_points(self):
+        """Test building the modelId -> point mapping."""
+        xml = (
+            '<dgm:ptLst xmlns:dgm="http://schemas.openxmlformats.org/drawingml/2006/diagram">'
+            '  <dgm:pt modelId="{id1}"/>'
+            "  <dgm:pt/>"
+            '  <dgm:pt modelId="{id2}"/>'
+            "</dgm:ptLst>"
+        )
+        pt_lst = parse_xml(xml)
+        pts = list(pt_lst.iter_pts())
+
+        assert pt_lst.pt_by_model_id() == {"{id1}": pts[0], "{id2}": pts[2]}
+
 
 class DescribeCT_DiagramPoint:
     """Unit-test suite for `pptx.oxml.diagram.CT_DiagramPoint` object."""
@@ -147,6 +192,20 @@ class DescribeCT_DiagramPoint:
         pt = parse_xml(xml)
         assert pt.text == ""
 
+    def it_returns_empty_string_when_single_run_is_empty(self):
+        """Test that point whose only run has no text returns empty string."""
+        xml = (
+            '<dgm:pt xmlns:dgm="http://schemas.openxmlformats.org/drawingml/2006/diagram"'
+            ' xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main"'
+            ' modelId="{test}">'
+            "  <dgm:t>"
+            "    <a:p><a:r><a:t/></a:r></a:p>"
+            "  </dgm:t>"
+            "</dgm:pt>"
+        )
+        pt = parse_xml(xml)
+        assert pt.text == ""
+
     def it_can_set_text_content(self):
         """Test setting text content in a point."""
         xml = (
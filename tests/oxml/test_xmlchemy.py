@@ -22,6 +22,7 @@ from pptx.oxml.xmlchemy import (
     ZeroOrMore,
     ZeroOrOne,
     ZeroOrOneChoice,
+    compiled_xpath,
 )
 
 from ..unitdata import BaseBuilder
@@ -32,6 +33,29 @@ class DescribeCustomElementClass(object):
         assert type(CT_Parent).__name__ == "MetaOxmlElement"
 
 
+class Describe_compiled_xpath(object):
+    def it_compiles_each_expression_only_once(self):
+        xpath = compiled_xpath("./p:foo")
+        assert compiled_xpath("./p:foo") is xpath
+
+    def it_evaluates_with_the_standard_namespace_mapping(self):
+        parent = a_parent().with_nsdecls().with_child(a_zomChild()).with_child(a_zomChild()).element
+        zomChildren = list(parent.iterchildren(qn("p:zomChild")))
+
+        assert len(zomChildren) == 2
+        assert compiled_xpath("./p:zomChild")(parent) == zomChildren
+
+    def it_shares_one_compiled_expression_across_xpath_variable_values(self):
+        parent = a_parent().with_nsdecls().with_child(a_zomChild()).element
+        zomChild = parent[0]
+        compiled_xpath("./p:zomChild[position()=$n]")
+        cache_size = compiled_xpath.cache_info().currsize
+
+        assert parent.xpath("./p:zomChild[position()=$n]", n=1) == [zomChild]
+        assert parent.xpath("./p:zomChild[position()=$n]", n=2) == []
+        assert compiled_xpath.cache_info().currsize == cache_size
+
+
 class DescribeChoice(object):
     def it_adds_a_getter_property_for_the_choice_element(self, getter_fixture):
         parent, expected_choice = getter_fixture
@@ -0,0 +1,37 @@
+"""Unit-test suite for `pptx.parts.diagram` module."""
+
+from __future__ import annotations
+
+from pptx.opc.constants import CONTENT_TYPE as CT
+from pptx.opc.package import OpcPackage
+from pptx.opc.packuri import PackURI
+from pptx.oxml import parse_xml
+from pptx.parts.diagram import DiagramDrawingPart
+
+from ..unitutil.mock import instance_mock
+
+
+class DescribeDiagramDrawingPart:
+    """Unit-test suite for `pptx.parts.diagram.DiagramDrawingPart` objects."""
+
+    def it_can_update_all_its_text_elements(self, request):
+        drawing = parse_xml(
+            '<dsp:drawing xmlns:dsp="http://schemas.microsoft.com/office/drawing/2008/diagram"'
+            ' xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main">'
+            "  <dsp:spTree>"
+            "    <dsp:sp><dsp:txBody><a:p><a:r><a:t>one</a:t></a:r></a:p></dsp:txBody></dsp:sp>"
+            "    <dsp:sp><dsp:txBody><a:p><a:r><a:t>two</a:t></a:r></a:p></dsp:txBody></dsp:sp>"
+            "    <dsp:sp><dsp:txBody><a:p><a:r><a:t>six</a:t></a:r></a:p></dsp:txBody></dsp:sp>"
+            "  </dsp:spTree>"
+            "</dsp:drawing>"
+        )
+        drawing_part = DiagramDrawingPart(
+            PackURI("/ppt/diagrams/drawing1.xml"),
+            CT.DML_DIAGRAM_DRAWING,
+            instance_mock(request, OpcPackage),
+            drawing,
+        )
+
+        drawing_part.update_all_text_elements(["foo", "bar"])
+
+        assert [t.text for t in drawing.iter("{*}t")] == ["foo", "bar", "six"]
@@ -6,6 +6,8 @@ import pytest
 
 from pptx.chart.chart import Chart
 from pptx.enum.shapes import MSO_SHAPE_TYPE
+from pptx.exc import InvalidXmlError
+from pptx.oxml.shapes.graphfrm import CT_GraphicalObjectFrame
 from pptx.parts.chart import ChartPart
 from pptx.parts.embeddedpackage import EmbeddedPackagePart
 from pptx.parts.slide import SlidePart
@@ -91,6 +93,26 @@ class DescribeGraphicFrame(object):
         graphicFrame = element("p:graphicFrame/a:graphic/a:graphicData{uri=%s}" % graphicData_uri)
         assert GraphicFrame(graphicFrame, None).has_smartart is expected_value
 
+    def it_reads_the_graphicData_uri_only_once(self, request):
+        graphicData_uri_ = property_mock(
+            request, CT_GraphicalObjectFrame, "graphicData_uri", return_value=GRAPHIC_DATA_URI_TABLE
+        )
+        graphic_frame = GraphicFrame(element("p:graphicFrame/a:graphic/a:graphicData"), None)
+
+        assert (graphic_frame.has_chart, graphic_frame.has_smartart, graphic_frame.has_table) == (
+            False,
+            False,
+            True,
+        )
+        assert graphic_frame.shape_type == MSO_SHAPE_TYPE.TABLE
+        graphicData_uri_.assert_called_once_with()
+
+    def but_its_shape_type_raises_when_the_graphicData_uri_is_missing(self):
+        graphic_frame = GraphicFrame(element("p:graphicFrame/a:graphic/a:graphicData"), None)
+
+        with pytest.raises(InvalidXmlError):
+            graphic_frame.shape_type
+
     def it_provides_access_to_the_OleFormat_object(self, request):
         ole_format_ = instance_mock(request, _OleFormat)
         _OleFormat_ = class_mock(
@@ -2,17 +2,119 @@
 
 from __future__ import annotations
 
+import copy
+import operator
+import os
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
+
 import pytest
+from lxml import etree
+from lxml.builder import ElementMaker
 
 from pptx import Presentation
 from pptx.enum.shapes import MSO_SHAPE_TYPE
-from pptx.oxml import parse_xml
-from pptx.parts.diagram import DiagramDataPart
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.opc.package import _Relationship
+from pptx.oxml import element_class_lookup
+from pptx.oxml.ns import namespaces, nsdecls, nsuri, qn
+from pptx.parts.diagram import DiagramDrawingPart
+from pptx.parts.slide import SlidePart
 from pptx.shapes.graphfrm import GraphicFrame
 from pptx.shapes.smartart import SmartArt, SmartArtNode, _SmartArtNodes
+from pptx.spec import GRAPHIC_DATA_URI_DIAGRAM
 
 from ..unitutil.cxml import element
-from ..unitutil.mock import instance_mock
+from ..unitutil.file import testfile
+from ..unitutil.mock import instance_mock, method_mock
+
+if TYPE_CHECKING:
+    from pptx.oxml.xmlchemy import BaseOxmlElement
+
+# -- fixture XML has no ids, comments, or entities, so a leaner parser than `parse_xml()` uses
+# -- suffices. It shares the custom element-class lookup so parsed elements are the same oxml
+# -- classes the package produces.
+_FIXTURE_PARSER = etree.XMLParser(
+    collect_ids=False, remove_blank_text=True, remove_comments=True, resolve_entities=False
+)
+_FIXTURE_PARSER.set_element_class_lookup(element_class_lookup)
+
+
+# -- namespace declarations for fixture root elements, built once from the package nsmap. Fixture
+# -- XML is held as `bytes` so it goes to the parser without a str -> bytes conversion.
+_DGM_A = nsdecls("dgm", "a").encode()
+
+
+def _parse(xml: bytes):
+    """Return the oxml root element parsed from fixture `xml`."""
+    return etree.fromstring(xml, _FIXTURE_PARSER)
+
+
+_PT_CACHE: dict[tuple[str | None, str | None, str | None], BaseOxmlElement] = {}
+
+
+def _make_pt(model_id: str | None, text: str | None = None, ptype: str | None = None):
+    """Return a new `dgm:pt` element, deep-copied from one parsed on first request.
+
+    When `text` is not None the point gets a `dgm:t` child holding a single run with that text.
+    """
+    key = (model_id, text, ptype)
+    if key not in _PT_CACHE:
+        attrs = b"" if model_id is None else b' modelId="%s"' % model_id.encode()
+        if ptype is not None:
+            attrs += b' type="%s"' % ptype.encode()
+        t = (
+            b""
+            if text is None
+            else b"<dgm:t><a:p><a:r><a:t>%s</a:t></a:r></a:p></dgm:t>" % text.encode()
+        )
+        _PT_CACHE[key] = _parse(b"<dgm:pt %s%s>%s</dgm:pt>" % (_DGM_A, attrs, t))
+    return copy.deepcopy(_PT_CACHE[key])
+
+
+def _make_pt_lst(*pts: BaseOxmlElement):
+    """Return a new `dgm:ptLst` element containing `pts`."""
+    pt_lst = _parse(b"<dgm:ptLst %s/>" % _DGM_A)
+    pt_lst.extend(pts)
+    return pt_lst
+
+
+def _make_data_model(*pts: BaseOxmlElement):
+    """Return a new `dgm:dataModel` element having `pts` in its `dgm:ptLst`."""
+    data_model = _parse(b"<dgm:dataModel %s><dgm:ptLst/><dgm:cxnLst/></dgm:dataModel>" % _DGM_A)
+    data_model.ptLst.extend(pts)
+    return data_model
+
+
+# -- graphic-frame fixtures are assembled directly as trees; there is no XML text to parse. The
+# -- fixture parser's `makeelement()` gives them the same oxml element classes parsed ones get.
+_GF_NSMAP = namespaces("p", "a", "dgm", "r")
+_P_E, _A_E, _DGM_E = (
+    ElementMaker(namespace=nsuri(pfx), nsmap=_GF_NSMAP, makeelement=_FIXTURE_PARSER.makeelement)
+    for pfx in ("p", "a", "dgm")
+)
+
+
+def _make_graphic_frame(*graphicData_children: BaseOxmlElement):
+    """Return a new SmartArt `p:graphicFrame` element with `graphicData_children` in its
+    `a:graphicData`."""
+    return _P_E.graphicFrame(
+        _P_E.nvGraphicFramePr(
+            _P_E.cNvPr(id="1", name="SmartArt"), _P_E.cNvGraphicFramePr(), _P_E.nvPr()
+        ),
+        _P_E.xfrm(_A_E.off(x="0", y="0"), _A_E.ext(cx="100", cy="100")),
+        _A_E.graphic(_A_E.graphicData(*graphicData_children, uri=GRAPHIC_DATA_URI_DIAGRAM)),
+    )
+
+
+# -- each data model is built once; tests get a deep copy so they can mutate it freely --
+_TEMPLATES = {
+    "data_model": _make_data_model(),
+    "data_model_with_points": _make_data_model(_make_pt("{id1}"), _make_pt("{id2}")),
+    "data_model_with_text": _make_data_model(
+        _make_pt("{id1}", "test1"), _make_pt("{id2}", "test2")
+    ),
+}
 
 
 class DescribeSmartArt:
@@ -29,6 +131,7 @@ class DescribeSmartArt:
         nodes = smartart.nodes
 
         assert isinstance(nodes, _SmartArtNodes)
+        assert all(node._smartart is smartart for node in nodes)
 
     def it_can_iterate_text_content(self, data_part_with_text_):
         """Test iterating text content."""
@@ -46,75 +149,124 @@ class DescribeSmartArt:
         assert isinstance(text_list, list)
         assert all(isinstance(text, str) for text in text_list)
 
+    def it_reports_one_string_per_node_in_text_content(self):
+        """Test that runs are joined per node and empty and non-content nodes are skipped."""
+        data_model = _parse(
+            b"<dgm:dataModel %s>"
+            b"  <dgm:ptLst>"
+            b'    <dgm:pt modelId="{id1}">'
+            b"      <dgm:t><a:p><a:r><a:t>fo</a:t></a:r><a:r><a:t>o</a:t></a:r></a:p></dgm:t>"
+            b"    </dgm:pt>"
+            b'    <dgm:pt modelId="{id2}"><dgm:t><a:p/></dgm:t></dgm:pt>'
+            b'    <dgm:pt modelId="{id3}" type="sibTrans">'
+            b"      <dgm:t><a:p><a:r><a:t>skip</a:t></a:r></a:p></dgm:t>"
+            b"    </dgm:pt>"
+            b'    <dgm:pt modelId="{id4}">'
+            b"      <dgm:t><a:p><a:r><a:t>bar</a:t></a:r></a:p></dgm:t>"
+            b"    </dgm:pt>"
+            b"  </dgm:ptLst>"
+            b"  <dgm:cxnLst/>"
+            b"</dgm:dataModel>" % _DGM_A
+        )
+        smartart = SmartArt(SimpleNamespace(data_model=data_model), None)
+
+        assert smartart.text_content == ["foo", "bar"]
+
+    def it_reflects_node_text_written_through_another_SmartArt_object(self, data_part_with_text_):
+        """Test text content is read fresh, e.g. after a write through a second `.smartart`."""
+        smartart = SmartArt(data_part_with_text_, None)
+        assert smartart.text_content == ["test1", "test2"]
+
+        list(SmartArt(data_part_with_text_, None).nodes)[1].text = "changed"
+
+        assert smartart.text_content == ["test1", "changed"]
+
+    def it_can_set_all_node_texts_at_once(self, data_part_with_text_, _sync_drawing_part_):
+        """Test bulk assignment of node text with a single drawing sync."""
+        smartart = SmartArt(data_part_with_text_, None)
+
+        smartart.set_node_texts(["foo", "bar"])
+
+        assert [node.text for node in smartart.nodes] == ["foo", "bar"]
+        assert smartart.text_content == ["foo", "bar"]
+        _sync_drawing_part_.assert_called_once_with(smartart)
+
+    def it_does_not_sync_the_drawing_when_node_text_is_unchanged(
+        self, data_part_with_text_, _sync_drawing_part_
+    ):
+        """Test that assigning a node its current text is a no-op."""
+        smartart = SmartArt(data_part_with_text_, None)
+        node = list(smartart.nodes)[0]
+
+        node.text = "test1"
+
+        _sync_drawing_part_.assert_not_called()
+
+        node.text = "changed"
+
+        _sync_drawing_part_.assert_called_once_with(smartart)
+
+    def it_resolves_its_drawing_parts_only_once(self, request, data_part_):
+        """Test that slide relationships are walked on first access only."""
+        drawing_part_ = instance_mock(request, DiagramDrawingPart)
+        rel_ = instance_mock(
+            request, _Relationship, reltype=RT.DIAGRAM_DRAWING, target_part=drawing_part_
+        )
+        other_rel_ = instance_mock(request, _Relationship, reltype=RT.IMAGE)
+        slide_part_ = instance_mock(request, SlidePart)
+        slide_part_.rels.values.return_value = [other_rel_, rel_]
+        graphic_frame_ = instance_mock(request, GraphicFrame, part=slide_part_)
+        smartart = SmartArt(data_part_, graphic_frame_)
+
+        assert smartart._drawing_parts == [drawing_part_]
+        assert smartart._drawing_parts == [drawing_part_]
+        slide_part_.rels.values.assert_called_once_with()
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
-    def data_part_(self, request):
-        xml = (
-            '<dgm:dataModel xmlns:dgm="http://schemas.openxmlformats.org/drawingml/2006/diagram">'
-            "  <dgm:ptLst/>"
-            "  <dgm:cxnLst/>"
-            "</dgm:dataModel>"
-        )
-        data_model = parse_xml(xml)
-        data_part = instance_mock(request, DiagramDataPart, data_model=data_model)
-        return data_part
+    def _sync_drawing_part_(self, request):
+        return method_mock(request, SmartArt, "_sync_drawing_part")
+
+    # -- `SmartArt` only reads `.data_model` from its data part, so a plain namespace object
+    # -- stands in for it; `instance_mock()` would build a spec'd mock for every test.
 
     @pytest.fixture
-    def data_part_with_points_(self, request):
-        xml = (
-            '<dgm:dataModel xmlns:dgm="http://schemas.openxmlformats.org/drawingml/2006/diagram"'
-            ' xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main">'
-            "  <dgm:ptLst>"
-            '    <dgm:pt modelId="{id1}"/>'
-            '    <dgm:pt modelId="{id2}"/>'
-            "  </dgm:ptLst>"
-            "  <dgm:cxnLst/>"
-            "</dgm:dataModel>"
-        )
-        data_model = parse_xml(xml)
-        data_part = instance_mock(request, DiagramDataPart, data_model=data_model)
-        return data_part
+    def data_part_(self):
+        data_model = copy.deepcopy(_TEMPLATES["data_model"])
+        return SimpleNamespace(data_model=data_model)
 
     @pytest.fixture
-    def data_part_with_text_(self, request):
-        xml = (
-            '<dgm:dataModel xmlns:dgm="http://schemas.openxmlformats.org/drawingml/2006/diagram"'
-            ' xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main">'
-            "  <dgm:ptLst>"
-            '    <dgm:pt modelId="{id1}">'
-            "      <dgm:t>"
-            "        <a:p><a:r><a:t>test1</a:t></a:r></a:p>"
-            "      </dgm:t>"
-            "    </dgm:pt>"
-            '    <dgm:pt modelId="{id2}">'
-            "      <dgm:t>"
-            "        <a:p><a:r><a:t>test2</a:t></a:r></a:p>"
-            "      </dgm:t>"
-            "    </dgm:pt>"
-            "  </dgm:ptLst>"
-            "  <dgm:cxnLst/>"
-            "</dgm:dataModel>"
-        )
-        data_model = parse_xml(xml)
-        data_part = instance_mock(request, DiagramDataPart, data_model=data_model)
-        return data_part
+    def data_part_with_points_(self):
+        data_model = copy.deepcopy(_TEMPLATES["data_model_with_points"])
+        return SimpleNamespace(data_model=data_model)
+
+    @pytest.fixture
+    def data_part_with_text_(self):
+        data_model = copy.deepcopy(_TEMPLATES["data_model_with_text"])
+        return SimpleNamespace(data_model=data_model)
 
 
 class Describe_SmartArtNodes:
     """Unit-test suite for `pptx.shapes.smartart._SmartArtNodes` object."""
 
+    # -- built once, when the class body executes; each test works on a deep copy --
+    _PT_LST_A = _make_pt_lst(
+        _make_pt("{id1}"),
+        _make_pt("{id2}"),
+        _make_pt("{id3}", ptype="pres"),  # Should be skipped
+    )
+    _PT_LST_MIXED = _make_pt_lst(
+        _make_pt("{id1}"),  # Include
+        _make_pt("{id2}", ptype="pres"),  # Exclude
+        _make_pt("{id3}", ptype="parTrans"),  # Exclude
+        _make_pt("{id4}", ptype="sibTrans"),  # Exclude
+        _make_pt("{id5}", ptype="doc"),  # Include
+    )
+
     def it_can_iterate_nodes(self):
         """Test iterating over nodes."""
-        xml = (
-            '<dgm:ptLst xmlns:dgm="http://schemas.openxmlformats.org/drawingml/2006/diagram"'
-            ' xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main">'
-            '  <dgm:pt modelId="{id1}"/>'
-            '  <dgm:pt modelId="{id2}"/>'
-            '  <dgm:pt modelId="{id3}" type="pres"/>'  # Should be skipped
-            "  </dgm:ptLst>"
-        )
-        pt_lst = parse_xml(xml)
+        pt_lst = copy.deepcopy(self._PT_LST_A)
         nodes = _SmartArtNodes(pt_lst, None, None)
         node_list = list(nodes)
 
@@ -124,32 +276,21 @@ class Describe_SmartArtNodes:
 
     def it_can_count_nodes(self):
         """Test counting nodes."""
-        xml = (
-            '<dgm:ptLst xmlns:dgm="http://schemas.openxmlformats.org/drawingml/2006/diagram"'
-            ' xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main">'
-            '  <dgm:pt modelId="{id1}"/>'
-            '  <dgm:pt modelId="{id2}"/>'
-            '  <dgm:pt modelId="{id3}" type="pres"/>'
-            "  </dgm:ptLst>"
-        )
-        pt_lst = parse_xml(xml)
+        pt_lst = copy.deepcopy(self._PT_LST_A)
         nodes = _SmartArtNodes(pt_lst, None, None)
 
         assert len(nodes) == 2
 
+    def it_gives_list_an_exact_size_hint(self):
+        """`list(nodes)` is presized from `__len__`, no `__length_hint__` is needed."""
+        pt_lst = copy.deepcopy(self._PT_LST_MIXED)
+        nodes = _SmartArtNodes(pt_lst, None, None)
+
+        assert operator.length_hint(nodes, -1) == len(list(nodes)) == 2
+
     def it_filters_out_presentation_nodes(self):
         """Test that presentation, transition nodes are filtered."""
-        xml = (
-            '<dgm:ptLst xmlns:dgm="http://schemas.openxmlformats.org/drawingml/2006/diagram"'
-            ' xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main">'
-            '  <dgm:pt modelId="{id1}"/>'  # Include
-            '  <dgm:pt modelId="{id2}" type="pres"/>'  # Exclude
-            '  <dgm:pt modelId="{id3}" type="parTrans"/>'  # Exclude
-            '  <dgm:pt modelId="{id4}" type="sibTrans"/>'  # Exclude
-            '  <dgm:pt modelId="{id5}" type="doc"/>'  # Include
-            "  </dgm:ptLst>"
-        )
-        pt_lst = parse_xml(xml)
+        pt_lst = copy.deepcopy(self._PT_LST_MIXED)
         nodes = _SmartArtNodes(pt_lst, None, None)
         node_list = list(nodes)
 
@@ -164,55 +305,34 @@ class DescribeSmartArtNode:
 
     def it_provides_text_property(self):
         """Test accessing node text."""
-        xml = (
-            '<dgm:pt xmlns:dgm="http://schemas.openxmlformats.org/drawingml/2006/diagram"'
-            ' xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main"'
-            ' modelId="{test}">'
-            "  <dgm:t>"
-            "    <a:p><a:r><a:t>Node Text</a:t></a:r></a:p>"
-            "  </dgm:t>"
-            "</dgm:pt>"
-        )
-        pt = parse_xml(xml)
+        pt = _make_pt("{test}", "Node Text")
         node = SmartArtNode(pt, None, None)
 
         assert node.text == "Node Text"
 
     def it_provides_model_id_property(self):
         """Test accessing node model ID."""
-        xml = (
-            '<dgm:pt xmlns:dgm="http://schemas.openxmlformats.org/drawingml/2006/diagram"'
-            ' modelId="{TEST-MODEL-ID}"/>'
-        )
-        pt = parse_xml(xml)
+        pt = _make_pt("{TEST-MODEL-ID}")
         node = SmartArtNode(pt, None, None)
 
         assert node.model_id == "{TEST-MODEL-ID}"
 
     def it_can_set_text_property(self):
         """Test setting node text."""
-        xml = (
-            '<dgm:pt xmlns:dgm="http://schemas.openxmlformats.org/drawingml/2006/diagram"'
-            ' xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main"'
-            ' modelId="{test}">'
-            "  <dgm:t>"
-            "    <a:p><a:r><a:t>Old Text</a:t></a:r></a:p>"
-            "  </dgm:t>"
-            "</dgm:pt>"
-        )
-        pt = parse_xml(xml)
+        pt = _make_pt("{test}", "Old Text")
+        a_t = pt.xpath("./dgm:t/a:p/a:r/a:t")[0]
         node = SmartArtNode(pt, None, None)
 
         node.text = "New Text"
+
+        # -- the existing run is updated in place; no elements are added or replaced --
         assert node.text == "New Text"
+        assert pt.xpath("./dgm:t/a:p/a:r/a:t") == [a_t]
+        assert a_t.text == "New Text"
 
     def it_provides_node_type_property(self):
         """Test accessing node type."""
-        xml = (
-            '<dgm:pt xmlns:dgm="http://schemas.openxmlformats.org/drawingml/2006/diagram"'
-            ' type="doc"/>'
-        )
-        pt = parse_xml(xml)
+        pt = _make_pt(None, ptype="doc")
         node = SmartArtNode(pt, None, None)
 
         assert node.node_type == "doc"
@@ -223,28 +343,11 @@ class DescribeGraphicFrameSmartArtIntegration:
 
     def it_knows_when_it_contains_smartart(self):
         """Test detecting SmartArt in graphic frame."""
-        xml = (
-            '<p:graphicFrame xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main"'
-            ' xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main"'
-            ' xmlns:dgm="http://schemas.openxmlformats.org/drawingml/2006/diagram"'
-            ' xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
-            "  <p:nvGraphicFramePr>"
-            '    <p:cNvPr id="1" name="SmartArt"/>'
-            "    <p:cNvGraphicFramePr/>"
-            "    <p:nvPr/>"
-            "  </p:nvGraphicFramePr>"
-            "  <p:xfrm>"
-            '    <a:off x="0" y="0"/>'
-            '    <a:ext cx="100" cy="100"/>'
-            "  </p:xfrm>"
-            "  <a:graphic>"
-            '    <a:graphicData uri="http://schemas.openxmlformats.org/drawingml/2006/diagram">'
-            '      <dgm:relIds r:dm="rId1" r:lo="rId2" r:qs="rId3" r:cs="rId4"/>'
-            "    </a:graphicData>"
-            "  </a:graphic>"
-            "</p:graphicFrame>"
+        graphic_frame_elm = _make_graphic_frame(
+            _DGM_E.relIds(
+                {qn("r:dm"): "rId1", qn("r:lo"): "rId2", qn("r:qs"): "rId3", qn("r:cs"): "rId4"}
+            )
         )
-        graphic_frame_elm = parse_xml(xml)
         graphic_frame = GraphicFrame(graphic_frame_elm, None)
 
         assert graphic_frame.has_smartart is True
@@ -253,84 +356,61 @@ class DescribeGraphicFrameSmartArtIntegration:
 
     def it_reports_correct_shape_type_for_smartart(self):
         """Test that SmartArt graphic frame reports correct shape type."""
-        xml = (
-            '<p:graphicFrame xmlns:p="http://schemas.openxmlformats.org/presentationml/2006/main"'
-            ' xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main"'
-            ' xmlns:dgm="http://schemas.openxmlformats.org/drawingml/2006/diagram">'
-            "  <p:nvGraphicFramePr>"
-            '    <p:cNvPr id="1" name="SmartArt"/>'
-            "    <p:cNvGraphicFramePr/>"
-            "    <p:nvPr/>"
-            "  </p:nvGraphicFramePr>"
-            "  <p:xfrm>"
-            '    <a:off x="0" y="0"/>'
-            '    <a:ext cx="100" cy="100"/>'
-            "  </p:xfrm>"
-            "  <a:graphic>"
-            '    <a:graphicData uri="http://schemas.openxmlformats.org/drawingml/2006/diagram"/>'
-            "  </a:graphic>"
-            "</p:graphicFrame>"
-        )
-        graphic_frame_elm = parse_xml(xml)
-        graphic_frame = GraphicFrame(graphic_frame_elm, None)
+        graphic_frame = GraphicFrame(_make_graphic_frame(), None)
 
         assert graphic_frame.shape_type == MSO_SHAPE_TYPE.SMART_ART
 
 
+@pytest.mark.xdist_group("smartart_pkg")
 class DescribeSmartArtAcceptanceTest:
     """Acceptance test using real PPTX file."""
 
-    def it_can_detect_smartart_in_test_file(self):
+    def it_can_detect_smartart_in_test_file(self, smartart_shape):
         """Test detecting SmartArt in smartart-test.pptx."""
-        try:
-            prs = Presentation("tests/test_files/smartart-test.pptx")
-        except FileNotFoundError:
-            pytest.skip("smartart-test.pptx not found")
-
-        # Slide 2 (index 1) contains SmartArt
-        slide = prs.slides[1]
-        shape = slide.shapes[0]
+        assert isinstance(smartart_shape, GraphicFrame)
+        assert smartart_shape.has_smartart is True
 
-        assert isinstance(shape, GraphicFrame)
-        assert shape.has_smartart is True
-
-    def it_can_extract_text_from_smartart(self):
+    def it_can_extract_text_from_smartart(self, smartart_shape):
         """Test extracting text content from SmartArt."""
-        try:
-            prs = Presentation("tests/test_files/smartart-test.pptx")
-        except FileNotFoundError:
-            pytest.skip("smartart-test.pptx not found")
-
-        slide = prs.slides[1]
-        shape = slide.shapes[0]
-
-        if not shape.has_smartart:
+        if not smartart_shape.has_smartart:
             pytest.skip("Shape is not SmartArt")
 
-        smartart = shape.smartart
+        smartart = smartart_shape.smartart
         texts = smartart.text_content
 
         # Should find 4 "test" strings
         test_texts = [t for t in texts if t == "test"]
         assert len(test_texts) == 4
 
-    def it_can_iterate_smartart_nodes(self):
+    def it_can_iterate_smartart_nodes(self, smartart_shape):
         """Test iterating over SmartArt nodes."""
-        try:
-            prs = Presentation("tests/test_files/smartart-test.pptx")
-        except FileNotFoundError:
-            pytest.skip("smartart-test.pptx not found")
-
-        slide = prs.slides[1]
-        shape = slide.shapes[0]
-
-        if not shape.has_smartart:
+        if not smartart_shape.has_smartart:
             pytest.skip("Shape is not SmartArt")
 
-        smartart = shape.smartart
+        smartart = smartart_shape.smartart
         nodes = list(smartart.nodes)
 
         assert len(nodes) > 0
         for node in nodes:
             assert isinstance(node, SmartArtNode)
             assert node.model_id is not None
+
+
+# ===========================================================================
+# fixtures
+# ===========================================================================
+
+
+@pytest.fixture(scope="session")
+def smartart_prs():
+    """smartart-test.pptx, loaded once and shared by the (read-only) acceptance tests."""
+    path = testfile("smartart-test.pptx")
+    if not os.path.isfile(path):
+        pytest.skip("smartart-test.pptx not found")
+    return Presentation(path)
+
+
+@pytest.fixture(scope="session")
+def smartart_shape(smartart_prs):
+    """The graphic frame on slide 2 (index 1) of smartart-test.pptx, which contains SmartArt."""
+    return smartart_prs.slides[1].shapes[0]